@@ -63,18 +63,25 @@ async function loadNeo4jData() {
       .map((s) => s.trim().replace(/;$/, ''))
       .filter((s) => s && !s.startsWith('//'));
 
+    // Run all seed statements inside one write transaction instead of an
+    // auto-commit round-trip per statement, so the load is also all-or-nothing
     let created = 0;
-    for (const statement of seedStatements) {
-      try {
-        await session.run(statement);
-        created++;
-        if (created % 10 === 0) {
-          console.log(`  Created ${created} nodes/relationships...`);
+    try {
+      await session.executeWrite(async (tx) => {
+        for (const statement of seedStatements) {
+          await tx.run(statement);
+          created++;
+          if (created % 10 === 0) {
+            console.log(`  Created ${created} nodes/relationships...`);
+          }
         }
-      } catch (err: any) {
-        console.error(`  ✗ Error executing statement: ${err.message}`);
-        console.error(`  Statement: ${statement.substring(0, 100)}...`);
-      }
+      });
+    } catch (err: any) {
+      console.error(`  ✗ Error executing statement: ${err.message}`);
+      console.error(
+        `  Statement: ${seedStatements[created]?.substring(0, 100)}...`
+      );
+      throw err;
     }
 
     console.log(`\n✅ Loaded ${created} Cypher statements\n`);
@@ -93,11 +100,15 @@ async function loadNeo4jData() {
       },
     ];
 
-    for (const { label, query } of counts) {
-      const result = await session.run(query);
-      const count = result.records[0].get('count').toNumber();
+    // The counts are independent; run them concurrently. A single session
+    // can't execute queries in parallel, so go through the driver's pool.
+    const countResults = await Promise.all(
+      counts.map(({ query }) => driver.executeQuery(query))
+    );
+    counts.forEach(({ label }, i) => {
+      const count = countResults[i].records[0].get('count').toNumber();
       console.log(`  ${label}: ${count}`);
-    }
+    });
 
     console.log('\n✨ Neo4j setup completed successfully!\n');
 
@@ -1,4 +1,4 @@
-import { PrismaClient } from '@prisma/client';
+import { Prisma, PrismaClient } from '@prisma/client';
 
 const prisma = new PrismaClient();
 
@@ -29,51 +29,64 @@ async function testDatabase() {
       'audit_log',
     ];
 
+    // One query for all tables instead of a round-trip per table
+    const existingTables = await prisma.$queryRaw<{ table_name: string }[]>`
+      SELECT table_name
+      FROM information_schema.tables
+      WHERE table_name IN (${Prisma.join(tables)});
+    `;
+    const existingNames = new Set(existingTables.map((t) => t.table_name));
+
     for (const table of tables) {
-      const result = await prisma.$queryRawUnsafe(`
-        SELECT EXISTS (
-          SELECT FROM information_schema.tables
-          WHERE table_name = '${table}'
-        );
-      `);
-      console.log(`   ✅ Table '${table}' exists`);
+      if (existingNames.has(table)) {
+        console.log(`   ✅ Table '${table}' exists`);
+      } else {
+        console.log(`   ❌ Table '${table}' missing`);
+      }
     }
     console.log('');
 
     // Test 3: Sample data counts
     console.log('3. Checking seed data...');
 
-    const crewCount = await prisma.crewMember.count();
-    console.log(`   ✅ Crew members: ${crewCount}`);
+    // The counts are independent, so run them concurrently instead of one
+    // round-trip at a time
+    const [
+      crewCount,
+      flightCount,
+      assignmentCount,
+      payPeriodCount,
+      payCalcCount,
+      discrepancyCount,
+      claimCount,
+      faaRuleCount,
+      contractTermCount,
+      notificationCount,
+      auditLogCount,
+    ] = await Promise.all([
+      prisma.crewMember.count(),
+      prisma.flight.count(),
+      prisma.crewAssignment.count(),
+      prisma.payPeriod.count(),
+      prisma.payCalculation.count(),
+      prisma.discrepancy.count(),
+      prisma.claim.count(),
+      prisma.faaRule.count(),
+      prisma.unionContractTerm.count(),
+      prisma.notification.count(),
+      prisma.auditLog.count(),
+    ]);
 
-    const flightCount = await prisma.flight.count();
+    console.log(`   ✅ Crew members: ${crewCount}`);
     console.log(`   ✅ Flights: ${flightCount}`);
-
-    const assignmentCount = await prisma.crewAssignment.count();
     console.log(`   ✅ Crew assignments: ${assignmentCount}`);
-
-    const payPeriodCount = await prisma.payPeriod.count();
     console.log(`   ✅ Pay periods: ${payPeriodCount}`);
-
-    const payCalcCount = await prisma.payCalculation.count();
     console.log(`   ✅ Pay calculations: ${payCalcCount}`);
-
-    const discrepancyCount = await prisma.discrepancy.count();
     console.log(`   ✅ Discrepancies: ${discrepancyCount}`);
-
-    const claimCount = await prisma.claim.count();
     console.log(`   ✅ Claims: ${claimCount}`);
-
-    const faaRuleCount = await prisma.faaRule.count();
     console.log(`   ✅ FAA rules: ${faaRuleCount}`);
-
-    const contractTermCount = await prisma.unionContractTerm.count();
     console.log(`   ✅ Contract terms: ${contractTermCount}`);
-
-    const notificationCount = await prisma.notification.count();
     console.log(`   ✅ Notifications: ${notificationCount}`);
-
-    const auditLogCount = await prisma.auditLog.count();
     console.log(`   ✅ Audit log entries: ${auditLogCount}\n`);
 
     // Test 4: Sample queries